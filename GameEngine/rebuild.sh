@@ -10,16 +10,32 @@ echo "  ./rebuild_fast.sh       - Preserves cached dependencies"
 echo "  ./rebuild_incremental.sh - Only recompiles changed files"
 echo ""
 
+# Use every core; nproc on Linux, sysctl on macOS
+JOBS=$(nproc 2>/dev/null || sysctl -n hw.ncpu 2>/dev/null || echo 8)
+# Fresh configurations use Makefiles, which the documented `make test`
+# targets rely on; export CMAKE_GENERATOR=Ninja to opt into Ninja
+CMAKE_GENERATOR_ARGS=(-G "${CMAKE_GENERATOR:-Unix Makefiles}")
+
 echo "Cleaning build directory..."
-rm -rf build
+# Sweep trees left behind by an earlier run that was interrupted (or
+# restarted) before its background delete finished
+for stale in build.trash.*; do
+    [ -d "$stale" ] && rm -rf "$stale"
+done
+# Move the old tree aside (a single rename) and delete it in the background
+# while CMake configures the new one
+if [ -d build ]; then
+    TRASH_DIR="build.trash.$$"
+    mv build "$TRASH_DIR" && (rm -rf "$TRASH_DIR" &)
+fi
 mkdir build
 cd build
 
 echo "Running CMake..."
-cmake .. -DCMAKE_BUILD_TYPE=Release
+cmake .. "${CMAKE_GENERATOR_ARGS[@]}" -DCMAKE_BUILD_TYPE=Release
 
 echo "Building project..."
-time make -j8
+time cmake --build . --parallel "$JOBS"
 
 if [ $? -eq 0 ]; then
     echo ""
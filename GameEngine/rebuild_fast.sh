@@ -6,7 +6,8 @@
 echo "=== Fast Rebuild with Cached Dependencies ==="
 
 # Check if dependencies exist in the correct location
-if [ ! -d ".deps_cache" ]; then
+# A populated raylib checkout is a stronger signal than the directory alone
+if [ ! -f ".deps_cache/raylib-src/CMakeLists.txt" ]; then
     echo "No cached dependencies found. Running full rebuild..."
     ./rebuild.sh
     exit 0
@@ -14,6 +15,12 @@ fi
 
 echo "Found cached dependencies in .deps_cache/"
 
+# Use every core; nproc on Linux, sysctl on macOS
+JOBS=$(nproc 2>/dev/null || sysctl -n hw.ncpu 2>/dev/null || echo 8)
+# Fresh configurations use Makefiles, which the documented `make test`
+# targets rely on; export CMAKE_GENERATOR=Ninja to opt into Ninja
+CMAKE_GENERATOR_ARGS=(-G "${CMAKE_GENERATOR:-Unix Makefiles}")
+
 # If build exists and has CMakeCache, just clean game_engine artifacts
 if [ -f "build/CMakeCache.txt" ]; then
     echo "Found existing CMake configuration"
@@ -28,12 +35,22 @@ else
     cd build
 fi
 
-# Configure if needed (CMake will skip if already configured)
-echo "Running CMake..."
-cmake .. -DCMAKE_BUILD_TYPE=Release
+# Configure only when there is no cache or CMakeLists.txt is newer than it;
+# otherwise the generated build files re-run CMake themselves if needed
+if [ ! -f "CMakeCache.txt" ] || [ "../CMakeLists.txt" -nt "CMakeCache.txt" ]; then
+    echo "Running CMake..."
+    if [ -f "CMakeCache.txt" ]; then
+        # Keep whatever generator the existing build directory uses
+        cmake .. -DCMAKE_BUILD_TYPE=Release
+    else
+        cmake .. "${CMAKE_GENERATOR_ARGS[@]}" -DCMAKE_BUILD_TYPE=Release
+    fi
+else
+    echo "CMake configuration is up to date, skipping configure"
+fi
 
 echo "Building project..."
-make -j8 game_engine
+cmake --build . --parallel "$JOBS" --target game_engine
 
 echo "Fast rebuild complete!"
 echo ""
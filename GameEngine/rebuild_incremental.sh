@@ -19,6 +19,9 @@ fi
 
 cd build
 
+# Use every core; nproc on Linux, sysctl on macOS
+JOBS=$(nproc 2>/dev/null || sysctl -n hw.ncpu 2>/dev/null || echo 8)
+
 # Check if CMakeLists.txt was modified
 if [ "../CMakeLists.txt" -nt "CMakeCache.txt" ]; then
     echo "CMakeLists.txt was modified, reconfiguring..."
@@ -26,7 +29,7 @@ if [ "../CMakeLists.txt" -nt "CMakeCache.txt" ]; then
 fi
 
 echo "Building project (incremental)..."
-time make -j8 game_engine
+time cmake --build . --parallel "$JOBS" --target game_engine
 
 if [ $? -eq 0 ]; then
     echo ""
@@ -12,14 +12,14 @@ check_source_changes() {
         return 1  # No executable, need rebuild
     fi
     
-    # Check if any source file is newer than the executable
-    # Using a more portable approach
-    for file in $(find src -name "*.cpp" -o -name "*.h" -type f); do
-        if [ "$file" -nt "build/game_engine" ]; then
-            echo "→ Changed file detected: $file"
-            return 1  # Source changed, need rebuild
-        fi
-    done
+    # Check if any source file is newer than the executable; find does the
+    # mtime comparison itself and stops at the first match
+    local changed
+    changed=$(find src -type f \( -name "*.cpp" -o -name "*.h" \) -newer "build/game_engine" -print -quit)
+    if [ -n "$changed" ]; then
+        echo "→ Changed file detected: $changed"
+        return 1  # Source changed, need rebuild
+    fi
     
     return 0  # No changes
 }
@@ -33,7 +33,7 @@ elif [ ! -f "build/CMakeCache.txt" ]; then
     echo "→ No CMake cache found"
     echo "→ Running full rebuild..."
     ./rebuild.sh
-elif [ ! -d ".deps_cache" ]; then
+elif [ ! -f ".deps_cache/raylib-src/CMakeLists.txt" ]; then
     echo "→ No cached dependencies found"
     echo "→ Running full rebuild to download dependencies..."
     ./rebuild.sh
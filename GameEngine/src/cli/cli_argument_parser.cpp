@@ -43,6 +43,9 @@ CLIArgumentParser::ParsedArgs CLIArgumentParser::parse(int argc, char* argv[]) {
                 args.mode = CLIMode::BATCH;
             }
         }
+        else if (arg == "--repl") {
+            args.mode = CLIMode::REPL;
+        }
         else if (arg == "--verbose") {
             args.verbose = true;
         }
@@ -82,6 +85,7 @@ Options:
   -p, --project PATH      Open project before executing commands
   --batch CMD1 CMD2...    Execute multiple commands
   --script FILE           Execute commands from script file
+  --repl                  Read commands from stdin, one result per line
   --verbose               Enable verbose output
   -q, --quiet             Suppress non-critical logs
   --log-level LEVEL       Set log level (trace/debug/info/warn/error/off)
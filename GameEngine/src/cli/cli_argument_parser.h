@@ -5,7 +5,8 @@
 enum class CLIMode {
     INTERACTIVE,    // Normal mode with window (current)
     BATCH,         // Execute script commands
-    SINGLE_COMMAND // One command and exit
+    SINGLE_COMMAND, // One command and exit
+    REPL           // Read commands from stdin until EOF
 };
 
 class CLIArgumentParser {
@@ -5,6 +5,7 @@
 #include <spdlog/spdlog.h>
 #include <sstream>
 #include <fstream>
+#include <iostream>
 #include <nlohmann/json.hpp>
 
 CLIEngine::CLIEngine() = default;
@@ -15,7 +16,7 @@ bool CLIEngine::initialize(CLIMode mode, bool headless, int argc, char* argv[])
     m_headless = headless;
     
     try {
-        if (mode == CLIMode::BATCH || mode == CLIMode::SINGLE_COMMAND || headless) {
+        if (mode == CLIMode::BATCH || mode == CLIMode::SINGLE_COMMAND || mode == CLIMode::REPL || headless) {
             return initializeHeadless();
         } else {
             return initializeGraphics();
@@ -158,6 +159,38 @@ CLIResult CLIEngine::executeBatch(const std::vector<std::string>& commands) {
     }
 }
 
+int CLIEngine::runRepl(std::istream& in, std::ostream& out, bool jsonOutput) {
+    std::string line;
+    while (std::getline(in, line)) {
+        if (!line.empty() && line.back() == '\r') {
+            line.pop_back();
+        }
+        
+        // Skip empty lines and comments, same as script files
+        if (line.empty() || line[0] == '#') {
+            continue;
+        }
+        
+        if (line == "exit" || line == "quit") {
+            break;
+        }
+        
+        CLIResult result = executeCommand(line);
+        
+        // std::endl flushes, so a reader on the other end of a pipe gets
+        // exactly one reply per command without waiting for EOF
+        if (jsonOutput) {
+            out << result.toJson().dump() << std::endl;
+        } else if (result.success) {
+            out << result.output << std::endl;
+        } else {
+            out << "Error: " << result.error << std::endl;
+        }
+    }
+    
+    return 0;
+}
+
 CLIResult CLIEngine::openProject(const std::string& projectPath) {
     return executeCommand("project.open " + projectPath);
 }
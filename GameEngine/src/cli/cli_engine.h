@@ -3,6 +3,7 @@
 #include <vector>
 #include <memory>
 #include <functional>
+#include <iosfwd>
 #include "cli_argument_parser.h"
 #include "cli_result.h"
 
@@ -22,6 +23,9 @@ public:
     CLIResult executeBatch(const std::string& scriptPath);
     CLIResult executeBatch(const std::vector<std::string>& commands);
     
+    // Execute newline-delimited commands from a stream until EOF or "exit"
+    int runRepl(std::istream& in, std::ostream& out, bool jsonOutput);
+    
     // Project management
     CLIResult openProject(const std::string& projectPath);
     CLIResult closeProject();
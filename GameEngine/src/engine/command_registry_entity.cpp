@@ -12,6 +12,10 @@
 
 namespace GameEngine {
 
+// Upper bound for entity.create_batch, so a mistyped count fails fast
+// instead of allocating without limit
+static constexpr int MAX_ENTITY_BATCH_COUNT = 100000;
+
 void CommandRegistry::registerEntityCommands(CommandProcessor* processor, Console* console, std::function<Scene*()> getScene, ResourceManager* resourceManager) {
     // entity.list command
     processor->registerCommand("entity.list",
@@ -72,7 +76,62 @@ void CommandRegistry::registerEntityCommands(CommandProcessor* processor, Consol
             }
         }, "Create a new entity", "Entity", "", createParams);
     }
-    
+
+    // entity.create_batch command
+    {
+        std::vector<CommandParameter> batchParams = {
+            {"count", "Number of entities to create", true}
+        };
+        processor->registerCommand("entity.create_batch",
+        [console, getScene](const std::vector<std::string>& args) {
+            Scene* scene = getScene();
+            if (!scene) {
+                console->addLine("Error: No active scene", RED);
+                return;
+            }
+
+            if (args.empty()) {
+                console->addLine("Error: Usage: entity.create_batch <count>", RED);
+                return;
+            }
+
+            int count = 0;
+            try {
+                size_t pos = 0;
+                count = std::stoi(args[0], &pos);
+                if (pos != args[0].size()) {
+                    count = -1;  // Trailing junk such as "10abc"
+                }
+            } catch (const std::exception&) {
+                count = -1;
+            }
+            if (count <= 0) {
+                console->addLine("Error: Invalid count: " + args[0], RED);
+                return;
+            }
+            if (count > MAX_ENTITY_BATCH_COUNT) {
+                console->addLine("Error: Count " + args[0] + " exceeds the maximum of " +
+                                 std::to_string(MAX_ENTITY_BATCH_COUNT), RED);
+                return;
+            }
+
+            auto& registry = scene->registry;
+            std::vector<uint32_t> ids;
+            ids.reserve(count);
+            for (int i = 0; i < count; ++i) {
+                ids.push_back((uint32_t)registry.create());
+            }
+
+            console->addLine("Created " + std::to_string(count) + " entities", GREEN);
+
+            // Set command data for CLI mode
+            if (console->isCaptureMode()) {
+                nlohmann::json data = {{"ids", ids}};
+                console->setCommandData(data);
+            }
+        }, "Create several entities in one command", "Entity", "", batchParams);
+    }
+
     // entity.destroy command
     {
         std::vector<CommandParameter> destroyParams = {
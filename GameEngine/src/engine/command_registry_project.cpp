@@ -8,6 +8,7 @@
 #include "../serialization/scene_serializer.h"
 #include <filesystem>
 #include <spdlog/spdlog.h>
+#include <nlohmann/json.hpp>
 
 namespace GameEngine {
 
@@ -136,6 +137,12 @@ void CommandRegistry::registerProjectCommands(CommandProcessor* processor, Conso
                     console->addLine("  - " + proj, WHITE);
                 }
             }
+            
+            // Set command data for CLI mode
+            if (console->isCaptureMode()) {
+                nlohmann::json data = {{"projects", projects}};
+                console->setCommandData(data);
+            }
         }, "List all projects", "Project");
     
     // project.info command
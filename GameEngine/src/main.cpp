@@ -43,7 +43,7 @@ int main(int argc, char* argv[]) {
     GameEngine::EnginePaths::initialize();
     
     // Configure log limiting for test mode
-    if (args.mode == CLIMode::BATCH || args.mode == CLIMode::SINGLE_COMMAND) {
+    if (args.mode == CLIMode::BATCH || args.mode == CLIMode::SINGLE_COMMAND || args.mode == CLIMode::REPL) {
         // In batch/test mode, limit repetitive messages
         GameEngine::LogLimiter::configure(3, 60, true);  // Max 3 messages per key per minute
     }
@@ -101,6 +101,9 @@ int main(int argc, char* argv[]) {
                 }
                 break;
                 
+            case CLIMode::REPL:
+                return cliEngine.runRepl(std::cin, std::cout, args.jsonOutput);
+                
             default:
                 result = CLIResult::Failure("Invalid CLI mode");
                 break;
@@ -11,95 +11,96 @@ def test_build_output():
     """Test if build produces output files despite CMake warnings"""
     print("=== Build Output Test ===\n")
     
-    # Move to build directory
-    original_dir = os.getcwd()
-    if os.path.basename(os.getcwd()) == "tests":
-        os.chdir("../build")
+    # Resolve the build directory instead of chdir-ing into it, so the
+    # process-wide cwd stays untouched when tests run side by side
+    build_dir = os.getcwd()
+    if os.path.basename(build_dir) == "tests":
+        build_dir = os.path.join(build_dir, "..", "build")
     elif not os.path.exists("game_engine"):
         if os.path.exists("build/game_engine"):
-            os.chdir("build")
+            build_dir = os.path.join(build_dir, "build")
     
-    try:
-        project_name = "BuildOutputTest"
-        
-        # Check if project already exists with cached dependencies
-        has_cached_deps = os.path.exists(f"output/{project_name}/build/_deps")
-        
-        # Don't clean up to preserve cached dependencies
-        # if os.path.exists(f"projects/{project_name}"):
-        #     shutil.rmtree(f"projects/{project_name}", ignore_errors=True)
-        # if os.path.exists(f"output/{project_name}"):
-        #     shutil.rmtree(f"output/{project_name}", ignore_errors=True)
-        
-        # Create script
-        script_name = "build_output_test.txt"
-        with open(script_name, "w") as f:
-            if not os.path.exists(f"projects/{project_name}"):
-                f.write(f"project.create {project_name}\n")
-            f.write(f"project.open {project_name}\n")
-            if not os.path.exists(f"projects/{project_name}"):
-                f.write("scene.create main\n")
-                f.write("entity.create Player\n")
-                f.write("scene.save main\n")
-            # Always try fast build first, fallback to full if needed
-            f.write("project.build.fast\n")
-            f.write("exit\n")
-        
-        print("Running build (ignoring return code)...")
-        result = subprocess.run(
-            ["./game_engine", "--headless", "--script", script_name],
-            capture_output=True,
-            text=True,
-            timeout=120  # Increase timeout to 2 minutes for slow CMake
-        )
-        
-        print(f"\nReturn code: {result.returncode}")
-        
-        # Check output files regardless of return code
-        output_dir = f"output/{project_name}"
-        print(f"\nChecking output directory: {output_dir}")
+    project_name = "BuildOutputTest"
+    project_dir = os.path.join(build_dir, "projects", project_name)
+    
+    # Check if project already exists with cached dependencies
+    has_cached_deps = os.path.exists(os.path.join(build_dir, "output", project_name, "build", "_deps"))
+    
+    # Don't clean up to preserve cached dependencies
+    # if os.path.exists(project_dir):
+    #     shutil.rmtree(project_dir, ignore_errors=True)
+    # if os.path.exists(output_dir):
+    #     shutil.rmtree(output_dir, ignore_errors=True)
+    
+    # Create script
+    script_name = "build_output_test.txt"
+    with open(os.path.join(build_dir, script_name), "w") as f:
+        if not os.path.exists(project_dir):
+            f.write(f"project.create {project_name}\n")
+        f.write(f"project.open {project_name}\n")
+        if not os.path.exists(project_dir):
+            f.write("scene.create main\n")
+            f.write("entity.create Player\n")
+            f.write("scene.save main\n")
+        # Always try fast build first, fallback to full if needed
+        f.write("project.build.fast\n")
+        f.write("exit\n")
+    
+    print("Running build (ignoring return code)...")
+    # Only the tail of stderr is shown, so keep the (large) build log as
+    # bytes and decode just that slice; stdout is never inspected
+    result = subprocess.run(
+        [os.path.join(build_dir, "game_engine"), "--headless", "--script", script_name],
+        cwd=build_dir,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        timeout=120  # Increase timeout to 2 minutes for slow CMake
+    )
+    
+    print(f"\nReturn code: {result.returncode}")
+    
+    # Check output files regardless of return code
+    output_dir = os.path.join(build_dir, "output", project_name)
+    print(f"\nChecking output directory: {output_dir}")
+    
+    if os.path.exists(output_dir):
+        print("✅ Output directory exists")
         
-        if os.path.exists(output_dir):
-            print("✅ Output directory exists")
-            
-            # List all files in output
-            for root, dirs, files in os.walk(output_dir):
-                level = root.replace(output_dir, '').count(os.sep)
-                indent = ' ' * 2 * level
-                print(f"{indent}{os.path.basename(root)}/")
-                subindent = ' ' * 2 * (level + 1)
-                for file in files:
-                    size = os.path.getsize(os.path.join(root, file))
-                    print(f"{subindent}{file} ({size:,} bytes)")
-            
-            # Check for executable in various locations
-            possible_exe_paths = [
-                f"{output_dir}/build/{project_name}",
-                f"{output_dir}/bin/{project_name}",
-                f"{output_dir}/{project_name}"
-            ]
-            
-            exe_found = False
-            for exe_path in possible_exe_paths:
-                if os.path.exists(exe_path):
-                    print(f"\n✅ Executable found: {exe_path}")
-                    exe_found = True
-                    break
-            
-            if not exe_found:
-                print("\n❌ No executable found in expected locations")
-        else:
-            print("❌ Output directory does not exist")
+        # List all files in output
+        for root, dirs, files in os.walk(output_dir):
+            level = root.replace(output_dir, '').count(os.sep)
+            indent = ' ' * 2 * level
+            print(f"{indent}{os.path.basename(root)}/")
+            subindent = ' ' * 2 * (level + 1)
+            for file in files:
+                size = os.path.getsize(os.path.join(root, file))
+                print(f"{subindent}{file} ({size:,} bytes)")
         
-        # Show last part of stderr to see warnings
-        if result.stderr:
-            print("\n=== Last 1000 chars of stderr ===")
-            print(result.stderr[-1000:])
+        # Check for executable in various locations
+        possible_exe_paths = [
+            f"{output_dir}/build/{project_name}",
+            f"{output_dir}/bin/{project_name}",
+            f"{output_dir}/{project_name}"
+        ]
         
-        os.remove(script_name)
+        exe_found = False
+        for exe_path in possible_exe_paths:
+            if os.path.exists(exe_path):
+                print(f"\n✅ Executable found: {exe_path}")
+                exe_found = True
+                break
         
-    finally:
-        os.chdir(original_dir)
+        if not exe_found:
+            print("\n❌ No executable found in expected locations")
+    else:
+        print("❌ Output directory does not exist")
+    
+    # Show last part of stderr to see warnings
+    if result.stderr:
+        print("\n=== Last 1000 chars of stderr ===")
+        print(result.stderr[-1000:].decode(errors="replace"))
+    
+    os.remove(os.path.join(build_dir, script_name))
 
 if __name__ == "__main__":
     test_build_output()
\ No newline at end of file
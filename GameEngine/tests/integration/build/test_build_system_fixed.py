@@ -7,6 +7,16 @@ import sys
 import time
 import shutil
 
+def wait_for_output(candidate_dirs, timeout, interval=0.05):
+    """Poll until one of candidate_dirs has the expected build layout"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        for out_dir in candidate_dirs:
+            if all(os.path.isdir(os.path.join(out_dir, d)) for d in ("scenes", "assets", "bin")):
+                return True
+        time.sleep(interval)
+    return False
+
 def test_build_system():
     """Test the build system with real compilation"""
     print("=== Game Engine Build System Test ===\n")
@@ -70,9 +80,10 @@ project.build --test"""
         print("Output:", result.stdout)
         return False
     
-    # Wait a bit for async build to complete
+    # Wait for the async build to lay out its output, but only as long as it
+    # actually takes (same 2 second ceiling as before)
     print("Waiting for build to complete...")
-    time.sleep(2)
+    wait_for_output([output_dir, f"output/{project_name}"], timeout=2.0)
     
     # Step 7: Verify output
     print("\nStep 7: Verifying output...")
@@ -88,11 +99,15 @@ project.build --test"""
         else:
             return False
     
-    # List what's in the output directory for debugging
-    if os.path.exists(output_dir):
-        print(f"Contents of {output_dir}:")
-        for item in os.listdir(output_dir):
-            print(f"  - {item}")
+    # List what's in the output directory for debugging; the same scandir
+    # pass tells us which entries are directories without extra stat calls
+    print(f"Contents of {output_dir}:")
+    with os.scandir(output_dir) as entries:
+        present_dirs = set()
+        for entry in entries:
+            print(f"  - {entry.name}")
+            if entry.is_dir():
+                present_dirs.add(entry.name)
     
     # In test mode, the build system creates directories but may fail to generate files
     # due to path mismatch between relative and absolute paths. This is a known issue
@@ -101,12 +116,7 @@ project.build --test"""
     
     # Check for expected directories
     expected_dirs = ["scenes", "assets", "bin"]
-    missing_dirs = []
-    
-    for dir_name in expected_dirs:
-        dir_path = os.path.join(output_dir, dir_name)
-        if not os.path.exists(dir_path):
-            missing_dirs.append(dir_name)
+    missing_dirs = [d for d in expected_dirs if d not in present_dirs]
     
     if missing_dirs:
         print(f"❌ Missing directories: {missing_dirs}")
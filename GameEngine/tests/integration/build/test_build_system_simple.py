@@ -31,10 +31,11 @@ project.build --test"""
     # Run all commands via script
     print("Running build commands via script...")
     start_time = time.time()
+    # stdout is never read and stderr only on failure: keep it as bytes
     result = subprocess.run(
         ["./game_engine", "--headless", "--script", script_file],
-        capture_output=True,
-        text=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
         timeout=60
     )
     elapsed = time.time() - start_time
@@ -43,7 +44,7 @@ project.build --test"""
     os.remove(script_file)
     
     if result.returncode != 0:
-        print(f"Failed to execute script: {result.stderr}")
+        print(f"Failed to execute script: {result.stderr.decode(errors='replace')}")
         return False
     
     print(f"✅ Build commands completed in {elapsed:.1f}s")
@@ -59,12 +60,9 @@ project.build --test"""
         
         # Check for expected directories
         expected_dirs = ["scenes", "assets", "bin"]
-        missing_dirs = []
-        
-        for dir_name in expected_dirs:
-            dir_path = os.path.join(output_dir, dir_name)
-            if not os.path.exists(dir_path):
-                missing_dirs.append(dir_name)
+        with os.scandir(output_dir) as entries:
+            present_dirs = {entry.name for entry in entries if entry.is_dir()}
+        missing_dirs = [d for d in expected_dirs if d not in present_dirs]
         
         if missing_dirs:
             print(f"❌ Missing directories: {missing_dirs}")
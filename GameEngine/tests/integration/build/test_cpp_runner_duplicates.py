@@ -5,6 +5,7 @@ import os
 import sys
 import subprocess
 import glob
+import shutil
 
 def test_cpp_tests_compile_without_duplicates():
     """Check that C++ tests compile without duplicate symbol errors"""
@@ -26,9 +27,12 @@ def test_cpp_tests_compile_without_duplicates():
     
     print(f"\nCompiling sample test: {test_name}")
     
-    # Basic compilation command (simplified for this test)
+    # Basic compilation command (simplified for this test); go through
+    # ccache when installed, like the engine build, so unchanged sources
+    # are not recompiled on every run
+    compiler = ["ccache", "c++"] if shutil.which("ccache") else ["c++"]
     compile_cmd = [
-        "c++", "-std=c++20", "-c", sample_test,
+        *compiler, "-std=c++20", "-c", sample_test,
         "-I../src",
         "-o", f"/tmp/{test_name}.o"
     ]
@@ -8,15 +8,31 @@ import subprocess
 import json
 import sys
 import os
+import io
+import uuid
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 
-def run_engine_command(command, project=None):
-    """Execute engine command and return JSON result"""
-    # Build path to executable
+# Shared engine helpers live in tests/unit/utils
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "unit", "utils"))
+from test_project_utils import EngineSession
+
+# One suffix for the whole run: the tests run in parallel workers, where
+# per-call timestamps from the same second would collide
+_RUN_ID = uuid.uuid4().hex[:8]
+
+@lru_cache(maxsize=None)
+def find_executable():
+    """Locate the engine once; __main__ has already chdir'd by first use"""
     exe_path = "./game_engine"
     if not os.path.exists(exe_path):
         exe_path = "./build/game_engine"
-    
-    cmd = [exe_path, "--json", "--headless"]
+    return exe_path
+
+def run_engine_command(command, project=None):
+    """Execute engine command and return JSON result"""
+    cmd = [find_executable(), "--json", "--headless"]
     
     if project:
         cmd.extend(["--project", project])
@@ -50,21 +66,23 @@ def test_basic_commands():
     assert result["success"], f"Project list failed: {result}"
     print("✅ Project list working")
     
-    # Test 3: Create project with unique name
-    print("\n3. Testing project creation...")
-    import time
-    test_proj_name = f"test_automation_{int(time.time())}"
-    result = run_engine_command(f"project.create {test_proj_name}")
-    assert result["success"], f"Project creation failed: {result}"
-    print("✅ Project creation working")
-    
-    # Test 4: Open project
-    print("\n4. Testing project open...")
-    result = run_engine_command(f"project.open {test_proj_name}")
-    assert result["success"], f"Project open failed: {result}"
-    print("✅ Project open working")
+    # Tests 3-4 build on each other, so they share one engine
+    with EngineSession(find_executable()) as session:
+        # Test 3: Create project with unique name
+        print("\n3. Testing project creation...")
+        test_proj_name = f"test_automation_{_RUN_ID}"
+        result = session.run_command(f"project.create {test_proj_name}")
+        assert result["success"], f"Project creation failed: {result}"
+        print("✅ Project creation working")
+        
+        # Test 4: Open project
+        print("\n4. Testing project open...")
+        result = session.run_command(f"project.open {test_proj_name}")
+        assert result["success"], f"Project open failed: {result}"
+        print("✅ Project open working")
     
     # Test 5: Test resource manager in headless (entity creation uses ResourceManager)
+    # Runs in a fresh engine with no project open
     print("\n5. Testing resource manager in headless...")
     result = run_engine_command("entity.create TestEntity")
     assert result["success"], f"Entity creation failed in headless: {result}"
@@ -77,13 +95,8 @@ def test_batch_commands():
     """Test batch command execution"""
     print("\nTesting batch commands...")
     
-    exe_path = "./game_engine"
-    if not os.path.exists(exe_path):
-        exe_path = "./build/game_engine"
-    
-    import time
-    batch_proj_name = f"batch_test_{int(time.time())}"
-    cmd = [exe_path, "--json", "--headless", "--batch",
+    batch_proj_name = f"batch_test_{_RUN_ID}"
+    cmd = [find_executable(), "--json", "--headless", "--batch",
            f"project.create {batch_proj_name}",
            "project.list"]
     
@@ -103,64 +116,77 @@ def test_resource_manager_headless():
     """Test ResourceManager works correctly in headless mode"""
     print("\nTesting ResourceManager in headless mode...")
     
-    # First create a test project and scene
-    import time
-    test_proj = f"test_rm_headless_{int(time.time())}"
-    result = run_engine_command(f"project.create {test_proj}")
-    assert result["success"], f"Project creation failed: {result}"
-    
-    result = run_engine_command(f"project.open {test_proj}")
-    assert result["success"], f"Project open failed: {result}"
-    
-    result = run_engine_command("scene.create test_scene")
-    assert result["success"], f"Scene creation failed: {result}"
-    
-    # Test 1: Create multiple entities
-    print("  - Creating multiple entities...")
-    entity_count = 10
-    for i in range(entity_count):
-        result = run_engine_command(f"entity.create TestEntity{i}", project=test_proj)
-        assert result["success"], f"Entity creation {i} failed: {result}"
-    
-    print(f"  ✅ Created {entity_count} entities successfully")
-    
-    # Test 2: Verify engine still responsive
-    result = run_engine_command("entity.list", project=test_proj)
-    assert result["success"], "Entity list failed after entity creation"
-    if "data" in result and result["data"] and "entities" in result["data"]:
-        assert len(result["data"]["entities"]) >= entity_count, f"Should have at least {entity_count} entities"
-    
-    print("  ✅ Engine remains responsive in headless mode")
-    
-    # Test 3: Save and load scene (tests ResourceManager indirectly)
-    result = run_engine_command("scene.save test_scene", project=test_proj)
-    assert result["success"], "Scene save failed"
-    print("  ✅ Scene saved successfully")
-    
-    result = run_engine_command("scene.load test_scene", project=test_proj)
-    assert result["success"], "Scene load failed"
-    print("  ✅ Scene loaded successfully")
+    # One engine for the whole scenario, so the project and scene opened
+    # here are the ones the entity and scene commands act on
+    with EngineSession(find_executable()) as session:
+        # First create a test project and scene
+        test_proj = f"test_rm_headless_{_RUN_ID}"
+        result = session.run_command(f"project.create {test_proj}")
+        assert result["success"], f"Project creation failed: {result}"
+        
+        result = session.run_command(f"project.open {test_proj}")
+        assert result["success"], f"Project open failed: {result}"
+        
+        result = session.run_command("scene.create test_scene")
+        assert result["success"], f"Scene creation failed: {result}"
+        
+        # Test 1: Create multiple entities
+        print("  - Creating multiple entities...")
+        entity_count = 10
+        for i in range(entity_count):
+            result = session.run_command(f"entity.create TestEntity{i}")
+            assert result["success"], f"Entity creation {i} failed: {result}"
+        
+        print(f"  ✅ Created {entity_count} entities successfully")
+        
+        # Test 2: Verify engine still responsive
+        result = session.run_command("entity.list")
+        assert result["success"], "Entity list failed after entity creation"
+        if "data" in result and result["data"] and "entities" in result["data"]:
+            assert len(result["data"]["entities"]) >= entity_count, f"Should have at least {entity_count} entities"
+        
+        print("  ✅ Engine remains responsive in headless mode")
+        
+        # Test 3: Save and load scene (tests ResourceManager indirectly)
+        result = session.run_command("scene.save test_scene")
+        assert result["success"], "Scene save failed"
+        print("  ✅ Scene saved successfully")
+        
+        result = session.run_command("scene.load test_scene")
+        assert result["success"], "Scene load failed"
+        print("  ✅ Scene loaded successfully")
     
     print("✅ ResourceManager works correctly in headless mode")
     return True
 
+def run_isolated(test):
+    """Run one test in a worker, returning (passed, captured output)"""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        try:
+            passed = bool(test())
+        except Exception as e:
+            print(f"\n❌ Test error: {e}")
+            passed = False
+    return passed, buffer.getvalue()
+
 if __name__ == "__main__":
-    try:
-        # Change to build directory if we're in the project root
-        if os.path.exists("build/game_engine"):
-            os.chdir("build")
-        
-        success = test_basic_commands()
-        success = test_batch_commands() and success
-        success = test_resource_manager_headless() and success
-        
-        if success:
-            print("\n🎉 All CLI tests passed!")
-            sys.exit(0)
-        else:
-            print("\n❌ Some tests failed")
-            sys.exit(1)
-            
-    except Exception as e:
-        print(f"\n❌ Test error: {e}")
-        sys.exit(1)
\ No newline at end of file
+    # Change to build directory if we're in the project root
+    if os.path.exists("build/game_engine"):
+        os.chdir("build")
+    
+    # The tests use separate projects, so they can run side by side;
+    # each worker's output is printed afterwards, in order
+    tests = [test_basic_commands, test_batch_commands, test_resource_manager_headless]
+    with ProcessPoolExecutor(max_workers=len(tests)) as executor:
+        results = list(executor.map(run_isolated, tests))
+    
+    for _, output in results:
+        print(output, end="")
+    
+    if all(passed for passed, _ in results):
+        print("\n🎉 All CLI tests passed!")
+        sys.exit(0)
+    else:
+        print("\n❌ Some tests failed")
+        sys.exit(1)
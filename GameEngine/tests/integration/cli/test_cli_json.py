@@ -5,6 +5,17 @@ import subprocess
 import json
 import sys
 import os
+import io
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+
+# orjson parses engine replies several times faster when it is installed;
+# its JSONDecodeError subclasses json's, so the except clauses still match
+try:
+    import orjson
+    parse_json = orjson.loads
+except ImportError:
+    parse_json = json.loads
 
 # Path to the game executable
 GAME_EXE = "../build/game_engine"
@@ -70,7 +81,7 @@ def test_json_help():
     result = run_cli_command(["--json", "--command", "help"])
     if result["success"]:
         try:
-            json_data = json.loads(result["stdout"])
+            json_data = parse_json(result["stdout"])
             print("✅ JSON output is valid")
             print(f"JSON keys: {list(json_data.keys())}")
             
@@ -97,7 +108,7 @@ def test_json_project_list():
     result = run_cli_command(["--json", "--headless", "--command", "project.list"])
     if result["success"]:
         try:
-            json_data = json.loads(result["stdout"])
+            json_data = parse_json(result["stdout"])
             print("✅ project.list JSON output is valid")
             print(f"JSON structure: {json.dumps(json_data, indent=2)[:300]}...")
         except json.JSONDecodeError:
@@ -116,7 +127,7 @@ def test_headless_project_create():
     result = run_cli_command(["--json", "--headless", "--command", f"project.create {project_name}"])
     if result["success"]:
         try:
-            json_data = json.loads(result["stdout"])
+            json_data = parse_json(result["stdout"])
             print(f"✅ Project creation returned valid JSON")
             print(f"Success: {json_data.get('success', False)}")
             print(f"Message: {json_data.get('output', 'No message')}")
@@ -152,7 +163,7 @@ def test_batch_commands():
     result = run_cli_command(batch_args)
     if result["success"]:
         try:
-            json_data = json.loads(result["stdout"])
+            json_data = parse_json(result["stdout"])
             print("✅ Batch execution returned valid JSON")
             
             if "data" in json_data and "results" in json_data.get("data", {}):
@@ -177,7 +188,7 @@ def test_invalid_command():
     result = run_cli_command(["--json", "--command", "invalid.command.test"])
     if result["returncode"] != 0:  # Should fail
         try:
-            json_data = json.loads(result["stdout"])
+            json_data = parse_json(result["stdout"])
             print("✅ Invalid command properly handled with JSON error")
             print(f"Success: {json_data.get('success', 'N/A')}")
             print(f"Error: {json_data.get('error', 'No error message')}")
@@ -188,6 +199,18 @@ def test_invalid_command():
         print("❌ Invalid command unexpectedly succeeded")
     print()
 
+def run_isolated(test):
+    """Run one test in a worker, returning its captured output and whether it passed"""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        try:
+            test()
+        except Exception as e:
+            print(f"❌ Test error: {e}")
+            print()
+    output = buffer.getvalue()
+    return output, "❌" not in output
+
 def main():
     """Run all tests"""
     print("=" * 60)
@@ -202,20 +225,36 @@ def main():
         print("  cd ../build && cmake .. && make")
         return 1
     
-    # Run tests
-    test_help()
-    test_version()
-    test_json_help()
-    test_json_project_list()
-    test_headless_project_create()
-    test_batch_commands()
-    test_invalid_command()
+    tests = [
+        test_help,
+        test_version,
+        test_json_help,
+        test_json_project_list,
+        test_headless_project_create,
+        test_batch_commands,
+        test_invalid_command,
+    ]
+    
+    # Each test is a separate engine invocation with nothing shared, so
+    # they run side by side and their output is printed afterwards, in
+    # order; --serial runs them one at a time for debugging
+    all_passed = True
+    if "--serial" in sys.argv:
+        for test in tests:
+            output, ok = run_isolated(test)
+            print(output, end="")
+            all_passed = all_passed and ok
+    else:
+        with ProcessPoolExecutor(max_workers=min(len(tests), os.cpu_count() or 1)) as executor:
+            for output, ok in executor.map(run_isolated, tests):
+                print(output, end="")
+                all_passed = all_passed and ok
     
     print("=" * 60)
-    print("Test suite completed!")
+    print("Test suite completed!" if all_passed else "Test suite completed with failures!")
     print("=" * 60)
     
-    return 0
+    return 0 if all_passed else 1
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
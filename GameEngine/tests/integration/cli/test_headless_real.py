@@ -10,18 +10,25 @@ import sys
 import os
 import time
 
-def run_engine_command(command, timeout=10):
-    """Execute engine command and return JSON result with timing"""
+# Shared engine helpers live in tests/unit/utils
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "unit", "utils"))
+from test_project_utils import EngineSession
+
+def find_executable():
+    """Path to the engine, from the build directory or the project root"""
     exe_path = "./game_engine"
     if not os.path.exists(exe_path):
         exe_path = "./build/game_engine"
-    
-    cmd = [exe_path, "--json", "--headless"]
+    return exe_path
+
+def run_engine_command(command, timeout=10):
+    """Execute engine command and return JSON result with timing"""
+    cmd = [find_executable(), "--json", "--headless"]
     cmd.extend(["--command", command])
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
-    elapsed_time = time.time() - start_time
+    elapsed_time = time.perf_counter() - start_time
     
     try:
         json_result = json.loads(result.stdout)
@@ -57,7 +64,7 @@ def test_headless_game_loop():
     
     # Test 3: Multiple commands with timing
     print("\n3. Testing time progression...")
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     # Run commands that would take some frames
     commands = [
@@ -69,18 +76,19 @@ def test_headless_game_loop():
         "scene.save main"
     ]
     
-    for cmd in commands:
-        result = run_engine_command(cmd, timeout=15)
-        assert result["success"], f"Command {cmd} failed: {result}"
+    with EngineSession(find_executable(), timeout=15) as session:
+        for cmd in commands:
+            result = session.run_command(cmd)
+            assert result["success"], f"Command {cmd} failed: {result}"
     
-    elapsed = time.time() - start_time
+    elapsed = time.perf_counter() - start_time
     print(f"✅ Multiple commands executed in {elapsed:.2f}s")
     
     # Test 4: Auto-exit behavior
     print("\n4. Testing auto-exit after operations...")
-    start_auto_exit = time.time()
+    start_auto_exit = time.perf_counter()
     result = run_engine_command("project.list")  # Simple command that should auto-exit
-    auto_exit_time = time.time() - start_auto_exit
+    auto_exit_time = time.perf_counter() - start_auto_exit
     
     assert result["success"], f"Auto-exit test failed: {result}"
     # Note: CLI commands execute immediately without running the game loop
@@ -94,21 +102,17 @@ def test_headless_interactive_mode():
     print("\nTesting headless interactive mode...")
     
     # Test headless mode without --command flag to trigger game loop
-    exe_path = "./game_engine"
-    if not os.path.exists(exe_path):
-        exe_path = "./build/game_engine"
-    
     # Run in headless mode with timeout to see if game loop runs
-    start_time = time.time()
+    start_time = time.perf_counter()
     try:
         result = subprocess.run(
-            [exe_path, "--headless"],
+            [find_executable(), "--headless"],
             input="quit\n",  # Send quit command to stop the loop
             capture_output=True,
             text=True,
             timeout=5  # Should auto-exit after 1 second
         )
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         print(f"✅ Headless interactive mode ran for {elapsed:.2f}s")
         
         # Should auto-exit after idle time
@@ -116,7 +120,7 @@ def test_headless_interactive_mode():
         assert elapsed < 3.0, f"Should auto-exit within 3s: {elapsed}s"
         
     except subprocess.TimeoutExpired:
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         print(f"✅ Headless mode running (timeout after {elapsed:.2f}s)")
 
 def test_headless_async_operations():
@@ -131,11 +135,14 @@ def test_headless_async_operations():
         "entity.create TestEntity"
     ]
     
-    for cmd in commands:
-        result = run_engine_command(cmd, timeout=15)
-        assert result["success"], f"Setup command {cmd} failed: {result}"
+    with EngineSession(find_executable(), timeout=15) as session:
+        for cmd in commands:
+            result = session.run_command(cmd)
+            assert result["success"], f"Setup command {cmd} failed: {result}"
     
-    # Try async build (this should work in headless)
+    # Try async build (this should work in headless). It stays a one-shot
+    # engine with no project open, as before: inside the session it would
+    # start a real build that engine shutdown then has to wait for
     print("  - Testing async build...")
     result = run_engine_command("project.build.async", timeout=30)
     
@@ -151,24 +158,26 @@ def test_headless_performance():
     """Test that headless mode performs well"""
     print("\nTesting headless performance...")
     
-    # Create multiple entities quickly
+    # Setup and the entity creations share one engine; only the creations
+    # are timed, so startup and project setup stay out of the metric
     setup_commands = [
         "project.create PerfTest",
         "project.open PerfTest", 
         "scene.create main"
     ]
+    entity_commands = [f"entity.create Entity{i}" for i in range(20)]  # Create 20 entities
     
-    for cmd in setup_commands:
-        result = run_engine_command(cmd, timeout=10)
-        assert result["success"], f"Setup failed: {result}"
-    
-    # Time creating many entities
-    start_perf = time.time()
-    for i in range(20):  # Create 20 entities
-        result = run_engine_command(f"entity.create Entity{i}", timeout=10)
-        assert result["success"], f"Entity creation {i} failed: {result}"
+    with EngineSession(find_executable(), timeout=15) as session:
+        for cmd in setup_commands:
+            result = session.run_command(cmd)
+            assert result["success"], f"Command {cmd} failed: {result}"
+        
+        start_perf = time.perf_counter()
+        for cmd in entity_commands:
+            result = session.run_command(cmd)
+            assert result["success"], f"Command {cmd} failed: {result}"
+        perf_time = time.perf_counter() - start_perf
     
-    perf_time = time.time() - start_perf
     entities_per_second = 20 / perf_time
     
     print(f"✅ Created 20 entities in {perf_time:.2f}s ({entities_per_second:.1f} entities/sec)")
@@ -5,36 +5,44 @@ import subprocess
 import json
 import sys
 import os
+import tempfile
+from functools import lru_cache
+
+@lru_cache(maxsize=None)
+def get_exe_path():
+    """Resolve the engine executable once, after __main__ has chdir'd"""
+    return "./game_engine" if os.path.exists("./game_engine") else "./build/game_engine"
+
+@lru_cache(maxsize=None)
+def get_base_argv():
+    """Argv prefix shared by every call; callers append the mode and its argument"""
+    return (get_exe_path(), "--json", "--headless")
 
 def test_headless_resource_loading():
     """Test that resource manager works in headless mode"""
     print("Testing headless resource manager...")
     
-    exe_path = "./game_engine" if os.path.exists("./game_engine") else "./build/game_engine"
-    
-    # Test basic headless operation
+    # Test basic headless operation; output stays bytes (json.loads takes
+    # them as-is) and is only decoded for failure messages
     result = subprocess.run(
-        [exe_path, "--json", "--headless", "--command", "help"],
+        (*get_base_argv(), "--command", "help"),
         capture_output=True,
-        text=True,
         timeout=10
     )
     
-    assert result.returncode == 0, f"Headless mode failed: {result.stderr}"
+    assert result.returncode == 0, f"Headless mode failed: {result.stderr[:500].decode(errors='replace')}"
     
     try:
         json_result = json.loads(result.stdout)
         assert json_result["success"] == True, "Help command failed in headless"
         print("✅ Basic headless operation works")
     except json.JSONDecodeError:
-        assert False, f"Invalid JSON output: {result.stdout}"
+        assert False, f"Invalid JSON output: {result.stdout[:500].decode(errors='replace')}"
 
 def test_entity_creation_headless():
     """Test entity creation (which uses ResourceManager) in headless"""
     print("Testing entity creation in headless mode...")
     
-    exe_path = "./game_engine" if os.path.exists("./game_engine") else "./build/game_engine"
-    
     # Use a unique project name to avoid conflicts
     import time
     project_name = f"HeadlessTest_{int(time.time())}"
@@ -46,27 +54,31 @@ def test_entity_creation_headless():
         "entity.list"
     ]
     
-    batch_file = "test_headless_batch.txt"
-    with open(batch_file, "w") as f:
+    # mkstemp creates and opens the script in one step under a unique name,
+    # on tmpfs when the host has one, instead of a fixed file in build/
+    fd, batch_file = tempfile.mkstemp(
+        prefix="test_headless_batch_", suffix=".txt",
+        dir="/dev/shm" if os.path.isdir("/dev/shm") else None
+    )
+    with os.fdopen(fd, "w") as f:
         for cmd in commands:
             f.write(cmd + "\n")
     
     try:
         result = subprocess.run(
-            [exe_path, "--json", "--headless", "--script", batch_file],
+            (*get_base_argv(), "--script", batch_file),
             capture_output=True,
-            text=True,
             timeout=15
         )
         
         os.remove(batch_file)
         
-        assert result.returncode == 0, f"Entity creation failed: {result.stderr}"
+        assert result.returncode == 0, f"Entity creation failed: {result.stderr[:500].decode(errors='replace')}"
         
         try:
             json_result = json.loads(result.stdout)
         except json.JSONDecodeError:
-            print(f"Invalid JSON output: {result.stdout}")
+            print(f"Invalid JSON output: {result.stdout[:500].decode(errors='replace')}")
             raise
             
         assert json_result["success"] == True, f"Batch commands failed: {json_result}"
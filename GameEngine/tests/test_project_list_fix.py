@@ -7,136 +7,117 @@ import subprocess
 import json
 import shutil
 
+# Shared engine helpers live in tests/unit/utils
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "unit", "utils"))
+from test_project_utils import EngineSession
+
+# Engine commands run with the build directory as their working directory
+BUILD_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'build'))
+PROJECTS_DIR = os.path.join(os.path.dirname(BUILD_DIR), 'projects')
+
+def open_projects_in_session(projects):
+    """Open each project through one long-lived engine process
+
+    The engine is started once in --repl mode and every project.open is
+    piped to it, instead of paying a full engine startup per project.
+    Returns a dict mapping project name to its JSON response.
+    """
+    with EngineSession("./game_engine", cwd=BUILD_DIR) as session:
+        return {
+            project: session.run_command(f"project.open {project}")
+            for project in projects
+        }
+
 def test_project_list_finds_existing_projects():
     """Test that project.list shows all existing projects"""
     print("Testing project.list command...")
     
-    # Run from build directory
-    original_dir = os.getcwd()
-    build_dir = os.path.join(os.path.dirname(__file__), '..', 'build')
-    os.chdir(build_dir)
-    
-    try:
-        # Check what projects exist in ../projects
-        projects_dir = "../projects"
-        existing_projects = []
-        if os.path.exists(projects_dir):
-            for item in os.listdir(projects_dir):
-                item_path = os.path.join(projects_dir, item)
-                if os.path.isdir(item_path):
-                    project_json = os.path.join(item_path, "project.json")
+    # Check what projects exist in ../projects
+    existing_projects = []
+    if os.path.exists(PROJECTS_DIR):
+        with os.scandir(PROJECTS_DIR) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    project_json = os.path.join(entry.path, "project.json")
                     if os.path.exists(project_json):
-                        existing_projects.append(item)
-        
-        print(f"Found {len(existing_projects)} existing projects: {existing_projects}")
-        
-        # Run project.list command
-        result = subprocess.run(
-            ["./game_engine", "--json", "--headless", "--command", "project.list"],
-            capture_output=True,
-            text=True
-        )
-        
-        assert result.returncode == 0, f"Command failed: {result.stderr}"
-        
-        # Parse JSON response
-        response = json.loads(result.stdout)
-        output = response.get("output", "")
-        
-        # Check if it found any projects
-        if "No projects found" in output:
-            if existing_projects:
-                print(f"✗ project.list shows 'No projects found' but {len(existing_projects)} projects exist!")
-                print(f"  Existing projects: {existing_projects}")
-                return False
-            else:
-                print("✓ No projects exist and project.list correctly shows none")
-                return True
-        
-        # Extract project names from output
-        listed_projects = []
-        lines = output.strip().split('\n')
-        for line in lines:
-            if line.strip().startswith("- "):
-                project_name = line.strip()[2:].strip()
-                listed_projects.append(project_name)
-        
-        print(f"project.list returned {len(listed_projects)} projects: {listed_projects}")
-        
-        # Check if all existing projects are listed
-        missing = set(existing_projects) - set(listed_projects)
-        extra = set(listed_projects) - set(existing_projects)
-        
-        if missing:
-            print(f"✗ Missing projects in list: {missing}")
-        if extra:
-            print(f"✗ Extra projects in list that don't exist: {extra}")
-        
-        if not missing and not extra:
-            print("✓ project.list correctly shows all existing projects")
-            return True
-        else:
+                        existing_projects.append(entry.name)
+    
+    print(f"Found {len(existing_projects)} existing projects: {existing_projects}")
+    
+    # Run project.list command
+    result = subprocess.run(
+        ["./game_engine", "--json", "--headless", "--command", "project.list"],
+        capture_output=True,
+        text=True,
+        cwd=BUILD_DIR
+    )
+    
+    assert result.returncode == 0, f"Command failed: {result.stderr}"
+    
+    # Parse JSON response - project names come back as structured data
+    response = json.loads(result.stdout)
+    listed_projects = (response.get("data") or {}).get("projects", [])
+    
+    # Check if it found any projects
+    if not listed_projects:
+        if existing_projects:
+            print(f"✗ project.list returned no projects but {len(existing_projects)} projects exist!")
+            print(f"  Existing projects: {existing_projects}")
             return False
-            
-    finally:
-        os.chdir(original_dir)
+        else:
+            print("✓ No projects exist and project.list correctly shows none")
+            return True
+    
+    print(f"project.list returned {len(listed_projects)} projects: {listed_projects}")
+    
+    # Check if all existing projects are listed
+    missing = set(existing_projects) - set(listed_projects)
+    extra = set(listed_projects) - set(existing_projects)
+    
+    if missing:
+        print(f"✗ Missing projects in list: {missing}")
+    if extra:
+        print(f"✗ Extra projects in list that don't exist: {extra}")
+    
+    if not missing and not extra:
+        print("✓ project.list correctly shows all existing projects")
+        return True
+    else:
+        return False
 
 def test_project_open_can_open_listed_projects():
     """Test that projects shown in project.list can actually be opened"""
     print("\nTesting that listed projects can be opened...")
     
-    # Run from build directory
-    original_dir = os.getcwd()
-    build_dir = os.path.join(os.path.dirname(__file__), '..', 'build')
-    os.chdir(build_dir)
-    
-    try:
-        # Get project list
-        result = subprocess.run(
-            ["./game_engine", "--json", "--headless", "--command", "project.list"],
-            capture_output=True,
-            text=True
-        )
-        
-        response = json.loads(result.stdout)
-        output = response.get("output", "")
-        
-        # Extract project names
-        listed_projects = []
-        if "No projects found" not in output:
-            lines = output.strip().split('\n')
-            for line in lines:
-                if line.strip().startswith("- "):
-                    project_name = line.strip()[2:].strip()
-                    listed_projects.append(project_name)
-        
-        if not listed_projects:
-            print("No projects listed to test opening")
-            return True
-        
-        # Try to open each listed project
-        failed_opens = []
-        for project in listed_projects:
-            result = subprocess.run(
-                ["./game_engine", "--json", "--headless", "--command", f"project.open {project}"],
-                capture_output=True,
-                text=True
-            )
-            
-            response = json.loads(result.stdout)
-            if not response.get("success", False) or "Failed to open" in response.get("output", ""):
-                failed_opens.append(project)
-                print(f"✗ Failed to open project '{project}' that was listed")
-        
-        if failed_opens:
-            print(f"✗ Could not open {len(failed_opens)} listed projects: {failed_opens}")
-            return False
-        else:
-            print(f"✓ All {len(listed_projects)} listed projects can be opened")
-            return True
-            
-    finally:
-        os.chdir(original_dir)
+    # Get project list
+    result = subprocess.run(
+        ["./game_engine", "--json", "--headless", "--command", "project.list"],
+        capture_output=True,
+        text=True,
+        cwd=BUILD_DIR
+    )
+    
+    response = json.loads(result.stdout)
+    listed_projects = (response.get("data") or {}).get("projects", [])
+    
+    if not listed_projects:
+        print("No projects listed to test opening")
+        return True
+    
+    # Try to open each listed project
+    failed_opens = []
+    responses = open_projects_in_session(listed_projects)
+    for project, response in responses.items():
+        if not response.get("success", False) or "Failed to open" in response.get("output", ""):
+            failed_opens.append(project)
+            print(f"✗ Failed to open project '{project}' that was listed")
+    
+    if failed_opens:
+        print(f"✗ Could not open {len(failed_opens)} listed projects: {failed_opens}")
+        return False
+    else:
+        print(f"✓ All {len(listed_projects)} listed projects can be opened")
+        return True
 
 def main():
     print("=== Project List Command Tests ===\n")
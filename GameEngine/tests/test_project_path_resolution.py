@@ -10,36 +10,30 @@ def test_engine_paths_info():
     """Display engine path information to understand resolution"""
     print("Testing engine path resolution...")
     
-    # Run from build directory
-    original_dir = os.getcwd()
-    build_dir = os.path.join(os.path.dirname(__file__), '..', 'build')
-    os.chdir(build_dir)
+    build_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'build'))
+    projects_dir = os.path.join(os.path.dirname(build_dir), 'projects')
     
-    try:
-        # Create a simple command to display paths
-        result = subprocess.run(
-            ["./game_engine", "--json", "--headless", "--command", "engine.paths"],
-            capture_output=True,
-            text=True
-        )
-        
-        # Even if command doesn't exist, let's check working directory
-        print(f"Working directory: {os.getcwd()}")
-        print(f"Absolute path: {os.path.abspath('.')}")
-        print(f"Projects should be in: {os.path.abspath('../projects')}")
-        print(f"Projects directory exists: {os.path.exists('../projects')}")
-        
-        if os.path.exists('../projects'):
-            print("\nProjects found:")
-            for item in os.listdir('../projects'):
-                item_path = os.path.join('../projects', item)
-                if os.path.isdir(item_path) and os.path.exists(os.path.join(item_path, 'project.json')):
-                    print(f"  - {item}")
-        
-        return True
-        
-    finally:
-        os.chdir(original_dir)
+    # Create a simple command to display paths
+    result = subprocess.run(
+        ["./game_engine", "--json", "--headless", "--command", "engine.paths"],
+        capture_output=True,
+        text=True,
+        cwd=build_dir
+    )
+    
+    # Even if command doesn't exist, let's check working directory
+    print(f"Working directory: {build_dir}")
+    print(f"Projects should be in: {projects_dir}")
+    print(f"Projects directory exists: {os.path.exists(projects_dir)}")
+    
+    if os.path.exists(projects_dir):
+        print("\nProjects found:")
+        with os.scandir(projects_dir) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False) and os.path.exists(os.path.join(entry.path, 'project.json')):
+                    print(f"  - {entry.name}")
+    
+    return True
 
 def main():
     print("=== Project Path Resolution Test ===\n")
@@ -14,18 +14,17 @@ def test_entity_create_returns_id():
     # Execute command
     result = subprocess.run(
         ["./game_engine", "--json", "--headless", "--command", "entity.create"],
-        capture_output=True,
-        text=True
+        capture_output=True
     )
     
     # Check return code
-    assert result.returncode == 0, f"Command failed with code {result.returncode}: {result.stderr}"
+    assert result.returncode == 0, f"Command failed with code {result.returncode}: {result.stderr.decode(errors='replace')}"
     
     # Parse JSON
     try:
         response = json.loads(result.stdout)
     except json.JSONDecodeError as e:
-        print(f"Failed to parse JSON: {result.stdout}")
+        print(f"Failed to parse JSON: {result.stdout.decode(errors='replace')}")
         raise
     
     # Verify response structure
@@ -45,12 +44,11 @@ def test_entity_create_with_position():
     
     result = subprocess.run(
         ["./game_engine", "--json", "--headless", "--command", "entity.create 10 20 30"],
-        capture_output=True,
-        text=True
+        capture_output=True
     )
     
     # Check return code
-    assert result.returncode == 0, f"Command failed with code {result.returncode}: {result.stderr}"
+    assert result.returncode == 0, f"Command failed with code {result.returncode}: {result.stderr.decode(errors='replace')}"
     
     # Parse JSON
     response = json.loads(result.stdout)
@@ -69,8 +67,7 @@ def test_entity_create_output_format():
     
     result = subprocess.run(
         ["./game_engine", "--json", "--headless", "--command", "entity.create"],
-        capture_output=True,
-        text=True
+        capture_output=True
     )
     
     response = json.loads(result.stdout)
@@ -88,9 +85,66 @@ def test_entity_create_output_format():
     
     print(f"✅ entity.create output format is correct and consistent")
 
+def test_entity_create_batch_returns_ids():
+    """Test entity.create_batch creates several entities in one process"""
+    
+    # We are already in the build directory when tests are run
+    
+    result = subprocess.run(
+        ["./game_engine", "--json", "--headless", "--command", "entity.create_batch 3"],
+        capture_output=True
+    )
+    
+    # Check return code
+    assert result.returncode == 0, f"Command failed with code {result.returncode}: {result.stderr.decode(errors='replace')}"
+    
+    # Parse JSON
+    response = json.loads(result.stdout)
+    
+    # Verify response
+    assert response["success"] == True, f"Command not successful: {response}"
+    assert response["data"] is not None, "Data field is None"
+    ids = response["data"]["ids"]
+    assert len(ids) == 3, f"Expected 3 IDs, got {ids}"
+    assert len(set(ids)) == 3, f"IDs are not unique: {ids}"
+    assert all(isinstance(entity_id, int) for entity_id in ids), f"IDs are not integers: {ids}"
+    
+    print(f"✅ entity.create_batch returns IDs in data field: {ids}")
+
+def test_entity_create_batch_rejects_huge_count():
+    """Test entity.create_batch refuses counts above its limit"""
+    
+    result = subprocess.run(
+        ["./game_engine", "--json", "--headless", "--command", "entity.create_batch 1000000000"],
+        capture_output=True, timeout=10
+    )
+    
+    response = json.loads(result.stdout)
+    assert response["success"] == False, f"Oversized batch was accepted: {response}"
+    assert result.returncode != 0, "Oversized batch returned exit code 0"
+    
+    print("✅ entity.create_batch rejects oversized counts")
+
+def test_entity_create_batch_rejects_trailing_junk():
+    """Test entity.create_batch refuses counts with trailing characters"""
+    
+    result = subprocess.run(
+        ["./game_engine", "--json", "--headless", "--command", "entity.create_batch 10abc"],
+        capture_output=True, timeout=10
+    )
+    
+    response = json.loads(result.stdout)
+    assert response["success"] == False, f"Malformed count was accepted: {response}"
+    assert result.returncode != 0, "Malformed count returned exit code 0"
+    
+    print("✅ entity.create_batch rejects malformed counts")
+
 if __name__ == "__main__":
     print("Testing entity.create command data field...")
     test_entity_create_returns_id()
     test_entity_create_with_position()
     test_entity_create_output_format()
+    test_entity_create_batch_returns_ids()
+    test_entity_create_batch_rejects_huge_count()
+    test_entity_create_batch_rejects_trailing_junk()
     print("\n✅ All entity.create tests passed!")
\ No newline at end of file
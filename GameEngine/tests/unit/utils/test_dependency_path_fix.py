@@ -6,6 +6,7 @@ Many Python tests fail because they can't find dependencies in the correct paths
 
 import os
 import sys
+import copy
 from pathlib import Path
 
 class DependencyPathResolver:
@@ -14,9 +15,18 @@ class DependencyPathResolver:
     def __init__(self):
         self.test_dir = Path(__file__).parent
         self.project_root = self.test_dir.parent
+        # Memo of a successful lookup shared by the include, library and
+        # validation helpers; a miss (None) is not stored, so a deps cache
+        # created later (e.g. by rebuild_fast.sh) is found
+        self._deps_dir = None
         
     def find_deps_directory(self):
         """Find the correct dependencies directory"""
+        if self._deps_dir is None:
+            self._deps_dir = self._search_deps_directory()
+        return self._deps_dir
+    
+    def _search_deps_directory(self):
         # Possible dependency locations in order of preference
         candidate_paths = [
             # Cache paths (direct, not in _deps subfolder)
@@ -153,13 +163,24 @@ def get_deps_directory():
     """Global function to get dependencies directory"""
     return get_dependency_resolver().find_deps_directory()
 
+# Flags are only kept once the deps cache has been found
+_compilation_flags = None
+
 def get_compilation_flags():
     """Global function to get compilation flags"""
-    return get_dependency_resolver().get_compilation_flags()
+    global _compilation_flags
+    if _compilation_flags is None:
+        flags = get_dependency_resolver().get_compilation_flags()
+        if flags['deps_dir'] is None:
+            return flags
+        _compilation_flags = flags
+    # Deep copy so callers can't modify the cached result
+    return copy.deepcopy(_compilation_flags)
 
 def validate_test_environment():
     """Global function to validate test environment"""
-    return get_dependency_resolver().validate_dependencies()
+    # A fresh resolver rescans, so dependencies set up mid-run are seen
+    return DependencyPathResolver().validate_dependencies()
 
 if __name__ == "__main__":
     # Test the dependency resolver
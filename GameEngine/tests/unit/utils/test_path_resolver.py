@@ -5,65 +5,100 @@ This provides the minimum functionality to make failing tests pass
 """
 
 import os
+import stat
 import sys
 from pathlib import Path
 
+# Possible executable paths in order of preference
+_STATIC_EXE_CANDIDATES = (
+    # If we're in build/ directory
+    "./game_engine",
+    # If we're in tests/ directory
+    "../build/game_engine",
+    # If we're in GameEngine/ root
+    "build/game_engine",
+    # If we're elsewhere, search up
+    "../game_engine",
+    "../../build/game_engine",
+)
+
+# Possible script locations
+_SCRIPT_DIR_CANDIDATES = (
+    # If we're in build/, scripts are in ../tests/
+    "../tests",
+    # If we're in tests/, scripts are in current dir
+    ".",
+    # If we're elsewhere
+    "tests",
+    "../GameEngine/tests",
+)
+
+def _stat_mode(path):
+    """Return st_mode for path, or None if it cannot be stat'ed"""
+    try:
+        return os.stat(path).st_mode
+    except OSError:
+        return None
+
+def _is_executable_file(path):
+    """Check regular file + executable bit with a single stat call"""
+    mode = _stat_mode(path)
+    return mode is not None and stat.S_ISREG(mode) and bool(mode & 0o111)
+
+def _is_regular_file(path):
+    """Check regular file with a single stat call"""
+    mode = _stat_mode(path)
+    return mode is not None and stat.S_ISREG(mode)
+
 class TestPathResolver:
     """Minimal path resolver for test execution"""
     
     def __init__(self):
         self.current_dir = Path.cwd()
         self.original_cwd = self.current_dir
+        # Per-instance memo of successful lookups; a miss (None) is not
+        # stored, so an engine built or directory created later is found
+        self._exe_path = None
+        self._tests_dir = None
+        self._build_dir = None
         
     def find_game_executable(self):
         """Find game_engine executable with intelligent path detection"""
-        # Possible executable paths in order of preference
-        candidate_paths = [
-            # If we're in build/ directory
-            "./game_engine",
-            # If we're in tests/ directory  
-            "../build/game_engine",
-            # If we're in GameEngine/ root
-            "build/game_engine",
-            # If we're elsewhere, search up
-            "../game_engine",
-            "../../build/game_engine",
-            # Absolute fallback
-            self._find_build_directory() / "game_engine" if self._find_build_directory() else None
-        ]
-        
-        for path in candidate_paths:
-            if path is None:
-                continue
-                
+        if self._exe_path is None:
+            self._exe_path = self._search_game_executable()
+        return self._exe_path
+    
+    def _search_game_executable(self):
+        for path in _STATIC_EXE_CANDIDATES:
             path = Path(path)
-            if path.exists() and path.is_file() and os.access(path, os.X_OK):
+            if _is_executable_file(path):
+                return str(path.resolve())
+        
+        # Absolute fallback - only walk the tree when the cheap candidates miss
+        build_dir = self._find_build_directory()
+        if build_dir:
+            path = build_dir / "game_engine"
+            if _is_executable_file(path):
                 return str(path.resolve())
         
         return None
     
     def find_script_file(self, script_name):
         """Find script file relative to test directory"""
-        # Possible script locations
-        candidate_dirs = [
-            # If we're in build/, scripts are in ../tests/
-            "../tests",
-            # If we're in tests/, scripts are in current dir
-            ".",
-            # If we're elsewhere
-            "tests",
-            "../GameEngine/tests"
-        ]
-        
-        for dir_path in candidate_dirs:
+        for dir_path in _SCRIPT_DIR_CANDIDATES:
             script_path = Path(dir_path) / script_name
-            if script_path.exists() and script_path.is_file():
+            if _is_regular_file(script_path):
                 return str(script_path.resolve())
         
         return None
     
     def get_tests_directory(self):
         """Get path to tests directory"""
+        if self._tests_dir is None:
+            self._tests_dir = self._search_tests_directory()
+        return self._tests_dir
+    
+    def _search_tests_directory(self):
         current = self.current_dir
         
         # If we're already in tests/
@@ -104,6 +139,11 @@ class TestPathResolver:
     
     def _find_build_directory(self):
         """Find build directory in project structure"""
+        if self._build_dir is None:
+            self._build_dir = self._search_build_directory()
+        return self._build_dir
+    
+    def _search_build_directory(self):
         current = self.current_dir
         
         # Check current directory
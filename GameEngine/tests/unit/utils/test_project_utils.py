@@ -6,26 +6,64 @@ Test utilities for preventing race conditions and ensuring cleanup
 import os
 import shutil
 import time
-import random
+import itertools
 import atexit
 import subprocess
 import json
+import queue
+import threading
 from typing import List, Dict, Any
 
+# Name prefixes of projects created by tests; a tuple so str.startswith
+# can check all of them in one call
+TEST_PATTERNS = (
+    "test_",
+    "cli_test",
+    "batch_test",
+    "automation_test",
+    "ResourceTest",
+    "TimeoutTestProject",
+    "CheckBuild",
+    "BuildTest"
+)
+
+# Process start time plus pid keeps names unique across concurrent runs;
+# the counter keeps them unique within this process without a syscall
+_BASE = f"{int(time.time()):x}{os.getpid():x}"
+_COUNTER = itertools.count()
+
+POSSIBLE_PROJECT_DIRS = ("projects", "../projects", "build/projects")
+POSSIBLE_OUTPUT_DIRS = ("output", "../output", "build/output")
+
+def _list_dir(path: str) -> frozenset:
+    """Names in a directory, or an empty set if it cannot be read"""
+    try:
+        with os.scandir(path) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
 class TestProjectManager:
     """Manages test projects to prevent race conditions and ensure cleanup"""
     
-    def __init__(self):
+    def __init__(self, register_atexit: bool = False):
         self.created_projects: List[str] = []
         self.projects_dir = "projects"
-        # Register cleanup on exit
-        atexit.register(self.cleanup_all)
+        # Only the shared module instance cleans up on exit; scoped
+        # instances should be used as context managers instead
+        if register_atexit:
+            atexit.register(self.cleanup_all)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.cleanup_all()
+        return False
         
     def generate_unique_name(self, base_name: str) -> str:
         """Generate unique project name to avoid conflicts"""
-        timestamp = int(time.time())
-        random_suffix = random.randint(1000, 9999)
-        unique_name = f"{base_name}_{timestamp}_{random_suffix}"
+        unique_name = f"{base_name}_{_BASE}_{next(_COUNTER)}"
         self.created_projects.append(unique_name)
         return unique_name
     
@@ -35,11 +73,7 @@ class TestProjectManager:
             return
             
         print(f"\n🧹 Cleaning up {len(self.created_projects)} test projects...")
-        removed_count = 0
-        
-        for project_name in self.created_projects:
-            if self.remove_project(project_name):
-                removed_count += 1
+        removed_count = self.remove_projects(self.created_projects)
                 
         print(f"✅ Cleaned up {removed_count} test projects")
         self.created_projects.clear()
@@ -47,14 +81,53 @@ class TestProjectManager:
     def remove_project(self, project_name: str) -> bool:
         """Remove a specific project"""
         project_path = os.path.join(self.projects_dir, project_name)
-        if os.path.exists(project_path):
-            try:
-                shutil.rmtree(project_path)
-                return True
-            except Exception as e:
-                print(f"  ⚠️ Failed to remove {project_name}: {e}")
-                return False
-        return False
+        # shutil.rmtree already walks the tree with dir_fd-relative
+        # scandir/unlink on POSIX; a missing project is just ENOENT here,
+        # which also covers another process removing it first
+        try:
+            shutil.rmtree(project_path)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            print(f"  ⚠️ Failed to remove {project_name}: {e}")
+            return False
+        return True
+    
+    def remove_projects(self, project_names: List[str]) -> int:
+        """Remove several projects, return how many were removed"""
+        if not project_names:
+            return 0
+        
+        if os.name == "posix" and shutil.which("rm"):
+            return self._remove_projects_rm(project_names)
+        
+        # rmtree is dominated by unlink syscalls, which release the GIL,
+        # so independent project trees can be deleted concurrently; the
+        # import is deferred since POSIX hosts never reach this path
+        from concurrent.futures import ThreadPoolExecutor
+        try:
+            workers = min(8, os.cpu_count() or 1, len(project_names))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(self.remove_project, project_names))
+        except RuntimeError:
+            # Thread pools refuse new work once the interpreter is shutting
+            # down, which is when the atexit cleanup runs
+            results = [self.remove_project(name) for name in project_names]
+        return sum(results)
+    
+    def _remove_projects_rm(self, project_names: List[str]) -> int:
+        """Delete projects with as few `rm -rf` processes as possible"""
+        existing = _list_dir(self.projects_dir)
+        paths = [
+            os.path.join(self.projects_dir, name)
+            for name in project_names if name in existing
+        ]
+        # Stay well under ARG_MAX on long cleanup lists
+        for start in range(0, len(paths), 1024):
+            subprocess.run(["rm", "-rf", "--", *paths[start:start + 1024]], check=False)
+        
+        remaining = _list_dir(self.projects_dir)
+        return sum(1 for name in project_names if name in existing and name not in remaining)
     
     def pre_test_cleanup(self):
         """Clean up any leftover test projects from previous runs"""
@@ -62,23 +135,15 @@ class TestProjectManager:
             return
             
         print("🧹 Pre-test cleanup...")
-        test_patterns = [
-            "test_",
-            "cli_test",
-            "batch_test",
-            "automation_test",
-            "ResourceTest",
-            "TimeoutTestProject",
-            "CheckBuild",
-            "BuildTest"
-        ]
         
-        removed = 0
         try:
-            for item in os.listdir(self.projects_dir):
-                if any(item.startswith(pattern) for pattern in test_patterns):
-                    if self.remove_project(item):
-                        removed += 1
+            # scandir hands back names without a stat per entry
+            with os.scandir(self.projects_dir) as entries:
+                leftovers = [
+                    entry.name for entry in entries
+                    if entry.name.startswith(TEST_PATTERNS)
+                ]
+            removed = self.remove_projects(leftovers)
                         
             if removed > 0:
                 print(f"  Removed {removed} leftover test projects")
@@ -86,7 +151,7 @@ class TestProjectManager:
             print(f"  ⚠️ Pre-cleanup failed: {e}")
 
 # Global instance
-project_manager = TestProjectManager()
+project_manager = TestProjectManager(register_atexit=True)
 
 def generate_unique_project_name(base_name: str) -> str:
     """Generate unique project name to avoid conflicts"""
@@ -100,6 +165,119 @@ def pre_test_cleanup():
     """Clean up leftover test projects"""
     project_manager.pre_test_cleanup()
 
+def run_engine(argv, **kwargs):
+    """subprocess.run for engine launches"""
+    # close_fds=False lets CPython launch the engine through posix_spawn
+    # (vfork-style, no page-table copy of the test process) instead of
+    # fork + exec; the engine does not rely on fds being closed
+    return subprocess.run(argv, close_fds=False, **kwargs)
+
+def run_engine_command(game_exe, command):
+    """Run a single engine command and capture its JSON output"""
+    return run_engine(
+        [game_exe, "--json", "-c", command],
+        capture_output=True,
+        text=True
+    )
+
+class EngineSession:
+    """One long-lived engine process fed commands over stdin (--repl mode)
+
+    Each command gets exactly one JSON line back, so tests issuing several
+    commands against the same engine state pay the startup cost once.
+    A reply that does not arrive within the timeout kills the engine.
+    """
+
+    def __init__(self, game_exe: str, cwd: str = None, timeout: float = 10):
+        self.game_exe = game_exe
+        self.cwd = cwd
+        self.timeout = timeout
+        self.process = None
+        self._lines = None
+        self._reader = None
+
+    def __enter__(self):
+        return self.start()
+
+    def start(self):
+        """Launch the engine; it initialises while waiting for a command"""
+        self.process = subprocess.Popen(
+            [self.game_exe, "--json", "--headless", "--repl"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=self.cwd
+        )
+        # readline() on a pipe cannot time out, so a reader thread feeds a
+        # queue and run_command waits on the queue instead
+        self._lines = queue.Queue()
+        self._reader = threading.Thread(target=self._read_lines, daemon=True)
+        self._reader.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def _read_lines(self):
+        for line in self.process.stdout:
+            self._lines.put(line)
+        self._lines.put(b"")
+
+    def run_command(self, command: str, timeout: float = None) -> Dict[str, Any]:
+        """Send one command and return the engine's parsed JSON reply
+
+        Raises subprocess.TimeoutExpired (after killing the engine) when no
+        reply arrives in time, and RuntimeError when the engine has exited
+        or answers with something other than JSON. Raises ValueError for
+        input the REPL does not answer with exactly one line: blank lines,
+        '#' comments, exit/quit, and anything containing a line break.
+        """
+        if (not command.strip() or command.startswith("#")
+                or command in ("exit", "quit") or "\n" in command or "\r" in command):
+            raise ValueError(f"Command gets no single REPL reply: {command!r}")
+        if timeout is None:
+            timeout = self.timeout
+        try:
+            self.process.stdin.write(command.encode() + b"\n")
+            self.process.stdin.flush()
+            line = self._lines.get(timeout=timeout)
+        except BrokenPipeError:
+            line = b""
+        except queue.Empty:
+            self.process.kill()
+            raise subprocess.TimeoutExpired(self.process.args, timeout)
+        if not line:
+            # Leave the end-of-output marker for any later call
+            self._lines.put(b"")
+            try:
+                code = self.process.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                code = None
+            raise RuntimeError(f"Engine exited (code {code}) before answering: {command}")
+        try:
+            return json.loads(line)
+        except json.JSONDecodeError:
+            raise RuntimeError(f"Non-JSON reply to {command!r}: {line!r}")
+
+    def close(self):
+        """Close stdin so the REPL loop ends, then reap the process"""
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.close()
+        except BrokenPipeError:
+            pass
+        try:
+            self.process.wait(timeout=self.timeout)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        finally:
+            self._reader.join(timeout=1)
+            self.process.stdout.close()
+            self.process = None
+
 def create_or_open_project(game_exe, project_name):
     """Create a project if it doesn't exist, otherwise just open it"""
     # Check if project exists
@@ -108,25 +286,13 @@ def create_or_open_project(game_exe, project_name):
     
     if project_exists:
         # Project exists, just open it
-        result = subprocess.run(
-            [game_exe, "--json", "-c", f"project.open {project_name}"],
-            capture_output=True,
-            text=True
-        )
+        result = run_engine_command(game_exe, f"project.open {project_name}")
     else:
         # Create new project
-        result = subprocess.run(
-            [game_exe, "--json", "-c", f"project.create {project_name}"],
-            capture_output=True,
-            text=True
-        )
+        result = run_engine_command(game_exe, f"project.create {project_name}")
         if result.returncode == 0:
             # Open the newly created project
-            result = subprocess.run(
-                [game_exe, "--json", "-c", f"project.open {project_name}"],
-                capture_output=True,
-                text=True
-            )
+            result = run_engine_command(game_exe, f"project.open {project_name}")
     
     return result
 
@@ -161,18 +327,8 @@ def get_build_command(project_name, force_full=False):
 
 def check_project_exists(project_name):
     """Check if a project exists in any of the common locations"""
-    possible_dirs = ["projects", "../projects", "build/projects"]
-    
-    for proj_dir in possible_dirs:
-        if os.path.exists(os.path.join(proj_dir, project_name)):
-            return True
-    return False
+    return any(os.path.exists(os.path.join(d, project_name)) for d in POSSIBLE_PROJECT_DIRS)
 
 def check_output_exists(project_name):
     """Check if build output exists for a project"""
-    possible_dirs = ["output", "../output", "build/output"]
-    
-    for out_dir in possible_dirs:
-        if os.path.exists(os.path.join(out_dir, project_name)):
-            return True
-    return False
+    return any(os.path.exists(os.path.join(d, project_name)) for d in POSSIBLE_OUTPUT_DIRS)